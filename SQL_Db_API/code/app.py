@@ -2,20 +2,26 @@ from flask import Flask
 from flask_restful import Api
 from flask_jwt import JWT
 
+from db import close_conn
 from security import authenticate, identity
 from user import UserRegister
 from item import Item, ItemList
 
 app = Flask(__name__)
+app.url_map.strict_slashes = False # /items/ and /item/<name>/ are served like /items and /item/<name> instead of 404
 app.secret_key = 'vish'
 api = Api(app)
 
 jwt = JWT(app, authenticate, identity) # /auth
 
+app.teardown_appcontext(close_conn)
+
 api.add_resource(Item, '/item/<string:name>')
 api.add_resource(ItemList, '/items')
 api.add_resource(UserRegister, '/register')
 
+app.url_map.update() # sort the rules once at import instead of on the first request
+
 if __name__== '__main__':
     app.run(port=5000, debug=True)
     
\ No newline at end of file
@@ -1,15 +1,20 @@
 import sqlite3
 
-connection = sqlite3.connect('data.db')
+from db import DATABASE
 
-cursor = connection.cursor()
-
-create_table = "CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, username text, password text)"
-cursor.execute(create_table)
+connection = sqlite3.connect(DATABASE)
 
-create_table = "CREATE TABLE IF NOT EXISTS items (name text, price real)"
-cursor.execute(create_table)
+cursor = connection.cursor()
 
-connection.commit()
+# WAL is persistent, so every later connection to data.db picks it up.
+# It has to be set outside the transaction that creates the tables.
+create_tables = """
+PRAGMA journal_mode=WAL;
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS users (id INTEGER PRIMARY KEY, username text, password text);
+CREATE TABLE IF NOT EXISTS items (name text, price real);
+COMMIT;
+"""
+cursor.executescript(create_tables)
 
 connection.close()
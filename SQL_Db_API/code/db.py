@@ -0,0 +1,35 @@
+import os
+import queue
+import sqlite3
+from flask import g
+
+DATABASE = os.environ.get('DB_PATH', 'data.db')
+POOL_SIZE = 5
+
+# Idle connections kept open between requests; each has its PRAGMAs set once when opened
+_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+
+def _connect():
+    connection = sqlite3.connect(DATABASE, check_same_thread=False)
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+# Checks a connection out of the pool into the app context for the rest of the request
+def get_conn():
+    if 'db' not in g:
+        try:
+            g.db = _pool.get_nowait()
+        except queue.Empty:
+            g.db = _connect()
+    return g.db
+
+# Registered with app.teardown_appcontext; rolls back anything a failed write left
+# uncommitted before the connection goes back to the pool
+def close_conn(exception=None):
+    connection = g.pop('db', None)
+    if connection is not None:
+        connection.rollback()
+        try:
+            _pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
@@ -1,8 +1,11 @@
 import sqlite3
-from sqlite3.dbapi2 import connect
 from flask_restful import Resource, reqparse
 from flask_jwt import jwt_required
 
+from db import get_conn
+
+SELECT_ALL_ITEMS = "SELECT name, price FROM items"
+
 class Item(Resource):
     parser = reqparse.RequestParser()
     parser.add_argument('price',
@@ -20,13 +23,12 @@ class Item(Resource):
 
     @classmethod
     def find_by_name(cls, name):
-        connection = sqlite3.connect('data.db')
+        connection = get_conn()
         cursor = connection.cursor()
 
         query = "SELECT * FROM items WHERE name=?"
         result = cursor.execute(query, (name,))
         row = result.fetchone()
-        connection.close()
 
         if row:
             return {'item': {'name': row[0], 'price': row[1]}} 
@@ -48,24 +50,22 @@ class Item(Resource):
 
     @classmethod
     def insert(cls, item):
-        connection = sqlite3.connect('data.db')
+        connection = get_conn()
         cursor = connection.cursor()
 
         query = "INSERT INTO items VALUES (?, ?)"
         cursor.execute(query, (item['name'], item['price']))
 
         connection.commit()
-        connection.close()
 
     def delete(self, name):
-        connection = sqlite3.connect('data.db')
+        connection = get_conn()
         cursor = connection.cursor()
 
         query = "DELETE FROM items WHERE name=?"
         cursor.execute(query, (name,))
 
         connection.commit()
-        connection.close()
         return {'message': 'Item deleted'}
 
     def put(self, name):
@@ -88,27 +88,19 @@ class Item(Resource):
 
     @classmethod
     def update(cls, item):
-        connection = sqlite3.connect('data.db')
+        connection = get_conn()
         cursor = connection.cursor()
 
         query = "UPDATE items SET price=? WHERE name=?"
         cursor.execute(query, (item['price'], item['name']))
 
         connection.commit()
-        connection.close()
 
 class ItemList(Resource):
     def get(self):
-        connection = sqlite3.connect('data.db')
+        connection = get_conn()
         cursor = connection.cursor()
+        cursor.row_factory = sqlite3.Row
 
-        query = "SELECT * FROM items"
-        result = cursor.execute(query)
-        items = []
-        for row in result:
-            items.append({'name': row[0], 'price': row[1]})
-
-        connection.close()
-
-        return {'items': items}
-        
\ No newline at end of file
+        rows = cursor.execute(SELECT_ALL_ITEMS).fetchall()
+        return {'items': [dict(row) for row in rows]}
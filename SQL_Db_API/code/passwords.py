@@ -0,0 +1,54 @@
+import base64
+import hashlib
+import hmac
+import os
+
+SALT_SIZE = 16
+
+SCRYPT = 'scrypt'
+SCRYPT_PARAMS = {'n': 2 ** 14, 'r': 8, 'p': 1}
+
+# Baseline rows stored the raw password; they are accepted once and rehashed
+PLAINTEXT = 'plaintext'
+
+# Stored as $scrypt$n=<n>,r=<r>,p=<p>$<b64 salt>$<b64 checksum>
+def hash_password(password):
+    salt = os.urandom(SALT_SIZE)
+    checksum = hashlib.scrypt(password.encode(), salt=salt, **SCRYPT_PARAMS)
+    return "${algorithm}${params}${salt}${checksum}".format(
+        algorithm=SCRYPT,
+        params=','.join(f"{key}={value}" for key, value in SCRYPT_PARAMS.items()),
+        salt=base64.b64encode(salt).decode(),
+        checksum=base64.b64encode(checksum).decode()
+    )
+
+def _split_hash(password_hash):
+    if needs_rehash(password_hash):
+        return PLAINTEXT, None, None, password_hash.encode()
+
+    try:
+        _, algorithm, params, salt, checksum = password_hash.split('$')
+        if algorithm == SCRYPT:
+            params = {key: int(value) for key, value in (param.split('=') for param in params.split(','))}
+        else:
+            return None
+        return algorithm, params, base64.b64decode(salt), base64.b64decode(checksum)
+    except ValueError:
+        return None
+
+def verify_password(password, password_hash):
+    hash_parts = _split_hash(password_hash)
+    if hash_parts is None:
+        return False
+
+    algorithm, params, salt, expected = hash_parts
+    if algorithm == SCRYPT:
+        result = hashlib.scrypt(password.encode(), salt=salt, dklen=len(expected), **params)
+    elif algorithm == PLAINTEXT:
+        result = password.encode()
+    else:
+        return False
+    return hmac.compare_digest(result, expected)
+
+def needs_rehash(password_hash):
+    return not password_hash.startswith(f"${SCRYPT}$")
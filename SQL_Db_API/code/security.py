@@ -1,11 +1,49 @@
-from werkzeug.security import safe_str_cmp
+import hashlib
+import hmac
+import os
+
+from cache import TTLCache
 from user import User
+from passwords import hash_password, needs_rehash, verify_password
+
+# username -> (keyed digest of the password, user id); raw passwords are never stored
+_auth_cache = TTLCache(maxsize=4096, ttl=30)
+_auth_cache_key = os.urandom(32)
+
+# user id -> User, so protected requests skip the SELECT on every JWT lookup
+_id_cache = TTLCache(maxsize=2048, ttl=30)
+
+def _password_digest(password):
+    return hashlib.blake2b(password.encode(), key=_auth_cache_key, digest_size=16).digest()
 
 def authenticate(username, password):
+    digest = _password_digest(password)
+    cached = _auth_cache.get(username)
+    if cached and hmac.compare_digest(cached[0], digest):
+        return _find_by_id(cached[1])
+
     user = User.find_by_username(username)
-    if user and safe_str_cmp(user.password, password):
+    if user and verify_password(password, user.password):
+        if needs_rehash(user.password):
+            _update_password(user, hash_password(password))
+        _auth_cache[username] = (digest, user.id)
+        _id_cache[user.id] = user
         return user
 
+# Every password change goes through here so the cached User never goes stale
+def _update_password(user, password):
+    user.password = password
+    User.update_password(user.id, password)
+    _id_cache.pop(user.id, None)
+
+def _find_by_id(user_id):
+    user = _id_cache.get(user_id)
+    if user is None:
+        user = User.find_by_id(user_id)
+        if user:
+            _id_cache[user_id] = user
+    return user
+
 def identity(payload):
     user_id = payload['identity']
-    return User.find_by_id(user_id)
+    return _find_by_id(user_id)
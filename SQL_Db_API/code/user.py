@@ -1,6 +1,9 @@
 import sqlite3
 from flask_restful import Resource, reqparse
 
+from db import get_conn
+from passwords import hash_password
+
 class User:
 
     TABLE_NAME = 'users'
@@ -12,37 +15,48 @@ class User:
 
     @classmethod
     def find_by_username(cls, username):
-        connection = sqlite3.connect('data.db')
+        connection = get_conn()
         cursor = connection.cursor()
+        cursor.row_factory = sqlite3.Row
 
         query = "SELECT * FROM {table} WHERE username=?".format(table=cls.TABLE_NAME)
         result = cursor.execute(query, (username,))
         row = result.fetchone()
         if row:
-            user = cls(*row)
+            user = cls(row["id"], row["username"], row["password"])
         else:
             user = None
 
-        connection.close()
         return user
 
 
     @classmethod
     def find_by_id(cls, _id):
-        connection = sqlite3.connect('data.db')
+        connection = get_conn()
         cursor = connection.cursor()
+        cursor.row_factory = sqlite3.Row
 
         query = "SELECT * FROM {table} WHERE id=?".format(table=cls.TABLE_NAME)
         result = cursor.execute(query, (_id,))
         row = result.fetchone()
         if row:
-            user = cls(*row)
+            user = cls(row["id"], row["username"], row["password"])
         else:
             user = None
 
-        connection.close()
         return user
 
+    # Call through security._update_password, which also drops the cached User
+    @classmethod
+    def update_password(cls, _id, password):
+        connection = get_conn()
+        cursor = connection.cursor()
+
+        query = "UPDATE {table} SET password=? WHERE id=?".format(table=cls.TABLE_NAME)
+        cursor.execute(query, (password, _id))
+
+        connection.commit()
+
 class UserRegister(Resource):
 
     TABLE_NAME = 'users'
@@ -65,13 +79,12 @@ class UserRegister(Resource):
         if User.find_by_username(data['username']):
             return {"message": "User with that username already exists."}, 400
 
-        connection = sqlite3.connect('data.db')
+        connection = get_conn()
         cursor = connection.cursor()
 
         query = "INSERT INTO {table} VALUES (NULL, ?, ?)".format(table=self.TABLE_NAME)
-        cursor.execute(query, (data['username'], data['password']))
+        cursor.execute(query, (data['username'], hash_password(data['password'])))
 
         connection.commit()
-        connection.close()
 
         return {"message": "User created successfully."}, 201